@@ -10,109 +10,533 @@ minimal environments.
 from __future__ import annotations
 
 import argparse
+import base64
+import contextlib
+import functools
+import hashlib
+import http.client
 import json
 import os
+import tempfile
 import textwrap
-import urllib.error
+import threading
+import time
 import urllib.parse
 import urllib.request
-from datetime import datetime, timezone
-from typing import Dict, Iterable, List, Mapping, MutableMapping, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# Number of decoded API responses kept in memory per report instance.
+_FETCH_MEMO_SIZE = 32
+# OpenAlex caps OR-filters at 100 values; one page of 200 therefore always holds a chunk.
+_OPENALEX_FILTER_LIMIT = 100
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 5
+# Transient failures (rate limiting, gateway errors, dropped connections) are retried with backoff.
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_ATTEMPTS = 3
+_MAX_RETRY_DELAY = 30.0
+# Only errors a later attempt can plausibly fix; TLS, DNS and redirect-loop failures raise immediately.
+_TRANSIENT_ERRORS = (ConnectionError, TimeoutError, http.client.RemoteDisconnected, http.client.IncompleteRead)
+# Only the fields read by _paper_metadata; OpenAlex trims the response server-side.
+_OPENALEX_SELECT = "id,display_name,publication_year,authorships,primary_location"
+_GITHUB_REPOSITORY_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    defaultBranchRef { name }
+    stargazerCount
+    forkCount
+    issues(states: OPEN) { totalCount }
+    pullRequests(states: OPEN) { totalCount }
+    primaryLanguage { name }
+    pushedAt
+  }
+}
+"""
+
+
+# Dedented once at import; render_html only fills in the placeholders.
+_HTML_TEMPLATE = textwrap.dedent(
+    """
+    <html>
+      <head>
+        <title>Reproducible AI Report</title>
+        <style>
+          body {{ font-family: Arial, sans-serif; margin: 2rem; }}
+          h1, h2, h3 {{ color: #12355b; }}
+          .card {{ border: 1px solid #e1e4e8; padding: 1rem; margin-bottom: 1rem; border-radius: 8px; }}
+          .grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(240px, 1fr)); gap: 1rem; }}
+          table {{ width: 100%; border-collapse: collapse; }}
+          th, td {{ padding: 0.5rem; border-bottom: 1px solid #e1e4e8; text-align: left; }}
+          code {{ background: #f6f8fa; padding: 0.2rem 0.4rem; border-radius: 4px; }}
+        </style>
+      </head>
+      <body>
+        <h1>Reproducible AI Report</h1>
+        <div class="card">
+          <h2>Paper</h2>
+          <p><strong>Title:</strong> {paper_title}</p>
+          <p><strong>Authors:</strong> {paper_authors}</p>
+          <p><strong>Published:</strong> {paper_published_year}</p>
+          <p><strong>Venue:</strong> {paper_venue}</p>
+          <p><strong>OpenAlex ID:</strong> <code>{paper_id}</code></p>
+        </div>
+
+        <div class="card">
+          <h2>Repository</h2>
+          <p><strong>GitHub:</strong> <code>{repo_github_id}</code></p>
+          <p><strong>Default branch:</strong> {repo_default_branch}</p>
+          <div class="grid">
+            <div><strong>Stars:</strong> {repo_stars}</div>
+            <div><strong>Forks:</strong> {repo_forks}</div>
+            <div><strong>Open issues:</strong> {repo_open_issues}</div>
+            <div><strong>Primary language:</strong> {repo_primary_language}</div>
+            <div><strong>Last push:</strong> {repo_updated_at}</div>
+          </div>
+        </div>
+
+        <div class="card">
+          <h2>Reproducibility Assessment</h2>
+          <p><strong>Class:</strong> {assessment_class}</p>
+          <p><strong>Rationale:</strong> {assessment_rationale}</p>
+          <h3>Real-world Evidence</h3>
+          <table>
+            <thead><tr><th>Dimension</th><th>Score</th></tr></thead>
+            <tbody>
+              {rwe_rows}
+            </tbody>
+          </table>
+          <p><strong>Aggregate RWE Score:</strong> {rwe_score}</p>
+        </div>
+
+        <div class="card">
+          <h2>Artifacts</h2>
+          {artifacts_html}
+        </div>
+
+        <p><em>Generated at {generated_at}</em></p>
+      </body>
+    </html>
+    """
+)
+
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"})
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+    """Seconds to wait after failed ``attempt``, preferring the server's ``Retry-After`` hint."""
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), _MAX_RETRY_DELAY)
+    return float(2 ** (attempt - 1))
+
+
+def _proxy_for(scheme: str, host: str) -> Optional[urllib.parse.SplitResult]:
+    """Proxy configured for ``scheme`` via ``*_PROXY`` variables, unless ``NO_PROXY`` exempts ``host``."""
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    return urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+
+
+def _proxy_auth_headers(proxy: urllib.parse.SplitResult) -> Dict[str, str]:
+    if proxy.username is None:
+        return {}
+    credentials = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+    return {"Proxy-Authorization": "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii")}
+
+
+def _escape(value: object) -> str:
+    """Escape ``value`` for HTML text and attributes; ``None`` renders as an empty string."""
+    return "" if value is None else str(value).translate(_HTML_ESCAPE_TABLE)
+
+
+@dataclass(frozen=True, slots=True)
+class RweScore:
+    """Real-world evidence dimensions and their aggregate, each rounded to two decimals."""
+
+    github_activity: float
+    huggingface_downloads: float
+    citations: float
+    community_adoption: float
+    aggregate: float
+
+    def as_dict(self) -> Dict[str, float]:
+        return asdict(self)
+
+
+@functools.lru_cache(maxsize=128)
+def _rwe_score(stars: float, forks: float, issues: float) -> RweScore:
+    def normalize(value: float, scale: float = 500.0) -> float:
+        return min(value / scale, 1.0)
+
+    github_activity = (normalize(stars) * 0.6) + (normalize(forks) * 0.3) + (normalize(max(1.0, issues)) * 0.1)
+    huggingface_downloads = 0.42  # Placeholder for future HF API integration.
+    citations = 0.38  # Placeholder until citation counts are ingested.
+    community_adoption = min((github_activity + huggingface_downloads) / 2, 1.0)
+    aggregate = (github_activity + huggingface_downloads + citations + community_adoption) / 4
+
+    return RweScore(
+        github_activity=round(github_activity, 2),
+        huggingface_downloads=round(huggingface_downloads, 2),
+        citations=round(citations, 2),
+        community_adoption=round(community_adoption, 2),
+        aggregate=round(aggregate, 2),
+    )
 
 
 class ReproAIReport:
     """Collect paper and repository metadata to build a reproducibility report."""
 
+    __slots__ = (
+        "paper_id",
+        "github_id",
+        "output_dir",
+        "github_token",
+        "cache_ttl",
+        "cache_dir",
+        "_owner",
+        "_repo",
+        "_repo_url",
+        "_gh_headers",
+        "_json_path",
+        "_html_path",
+        "_memo",
+        "_memo_lock",
+        "_connections",
+        "_pool_lock",
+    )
+
     def __init__(
         self,
         paper_id: str,
         github_id: str,
         output_dir: str = "reports",
         github_token: Optional[str] = None,
+        cache_ttl: float = 3600.0,
     ) -> None:
         self.paper_id = paper_id
         self.github_id = github_id
         self.output_dir = output_dir
         self.github_token = github_token or os.getenv("GITHUB_TOKEN")
+        self.cache_ttl = cache_ttl
+
+        owner, _, repo = urllib.parse.urlparse(github_id).path.strip("/").partition("/")
+        repo = repo.removesuffix(".git")
+        # Only the repository root is accepted; deeper paths (/tree/main, /issues) are not repositories.
+        if not owner or not repo or "/" in repo:
+            raise ValueError(f"Expected a GitHub URL like https://github.com/<owner>/<repo>, got {github_id!r}")
+        self._owner = owner
+        self._repo = repo
+        self._repo_url = f"https://api.github.com/repos/{owner}/{repo}"
+        self._gh_headers = {"Accept": "application/vnd.github+json"}
+        if self.github_token:
+            self._gh_headers["Authorization"] = f"Bearer {self.github_token}"
+
+        # Created once here (with output_dir) rather than on every run or cache write.
+        self.cache_dir = os.path.join(output_dir, ".cache")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        slug = repo.rsplit("/", maxsplit=1)[-1]
+        self._json_path = os.path.join(output_dir, f"{slug}.json")
+        self._html_path = os.path.join(output_dir, f"{slug}.html")
+
+        # (monotonic fetch time, decoded body) keyed on (url, sorted headers, POST body).
+        self._memo: "OrderedDict[Tuple[str, Tuple[Tuple[str, str], ...], Optional[bytes]], Tuple[float, Dict]]" = (
+            OrderedDict()
+        )
+        self._memo_lock = threading.Lock()
+        # Idle keep-alive connections per (scheme, host, proxy), reused across requests.
+        self._connections: Dict[Tuple[str, str, str], List[http.client.HTTPConnection]] = {}
+        self._pool_lock = threading.Lock()
 
     # ---------------------------- Fetchers ----------------------------
-    def fetch_json(self, url: str, headers: Optional[Mapping[str, str]] = None) -> Dict:
+    def fetch_json(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        data: Optional[Mapping[str, object]] = None,
+        validate: Optional[Callable[[Dict], None]] = None,
+    ) -> Dict:
+        """GET ``url``, or POST ``data`` as a JSON body when given, and decode the JSON response.
+
+        ``validate`` may raise to reject a successful response; rejected bodies are never cached.
+        The returned payload is memoised and shared between callers, so treat it as read-only.
+        """
+        encoded = json.dumps(data, sort_keys=True).encode("utf-8") if data is not None else None
+        memo_key = (url, tuple(sorted(headers.items())) if headers else (), encoded)
+        with self._memo_lock:
+            entry = self._memo.get(memo_key)
+            # Entries expire with cache_ttl so long-lived instances still reach disk-cache revalidation.
+            if entry is not None and time.monotonic() - entry[0] < self.cache_ttl:
+                self._memo.move_to_end(memo_key)
+                return entry[1]
+
+        body = self._fetch_json(url, headers, encoded, validate)
+        with self._memo_lock:
+            self._memo[memo_key] = (time.monotonic(), body)
+            self._memo.move_to_end(memo_key)
+            if len(self._memo) > _FETCH_MEMO_SIZE:
+                self._memo.popitem(last=False)
+        return body
+
+    def _fetch_json(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        data: Optional[bytes] = None,
+        validate: Optional[Callable[[Dict], None]] = None,
+    ) -> Dict:
         request_headers = {"User-Agent": "reproai-cli/0.1"}
         if headers:
             request_headers.update(headers)
-
-        request = urllib.request.Request(url, headers=request_headers)
-        try:
-            with urllib.request.urlopen(request, timeout=15) as response:  # noqa: S310
-                return json.loads(response.read().decode("utf-8"))
-        except urllib.error.HTTPError as exc:  # pragma: no cover - runtime safeguard
-            raise RuntimeError(f"Failed to fetch {url}: {exc.read().decode('utf-8')}") from exc
-        except urllib.error.URLError as exc:  # pragma: no cover - runtime safeguard
-            raise RuntimeError(f"Failed to fetch {url}: {exc.reason}") from exc
+        if data is not None:
+            request_headers["Content-Type"] = "application/json"
+
+        cache_path = self._cache_path(url, request_headers, data)
+        cached = self._read_cache(cache_path)
+        if cached is not None:
+            if time.time() - cached["fetched_at"] < self.cache_ttl:
+                return cached["body"]
+            # Stale entry: revalidate so an unchanged resource costs a 304, not a full body.
+            if cached.get("etag"):
+                request_headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                request_headers["If-Modified-Since"] = cached["last_modified"]
+
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            retry_after = None
+            try:
+                status, response_headers, raw = self._request(url, request_headers, data)
+            except _TRANSIENT_ERRORS as exc:
+                if attempt == _MAX_ATTEMPTS:
+                    raise RuntimeError(f"Failed to fetch {url}: {exc}") from exc
+            except (http.client.HTTPException, OSError) as exc:
+                raise RuntimeError(f"Failed to fetch {url}: {exc}") from exc
+            else:
+                if status not in _RETRY_STATUSES or attempt == _MAX_ATTEMPTS:
+                    break
+                retry_after = response_headers.get("Retry-After")
+            time.sleep(_retry_delay(attempt, retry_after))
+
+        if status == 304 and cached is not None:
+            body = cached["body"]
+            etag = response_headers.get("ETag") or cached.get("etag")
+            last_modified = response_headers.get("Last-Modified") or cached.get("last_modified")
+        elif 200 <= status < 300:
+            body = json.loads(raw)
+            if validate is not None:
+                validate(body)
+            etag = response_headers.get("ETag")
+            last_modified = response_headers.get("Last-Modified")
+        else:  # pragma: no cover - runtime safeguard
+            raise RuntimeError(f"Failed to fetch {url}: {raw.decode('utf-8', errors='replace')}")
+
+        self._write_cache(
+            cache_path,
+            {"fetched_at": time.time(), "etag": etag, "last_modified": last_modified, "body": body},
+        )
+        return body
 
     def fetch_paper_metadata(self) -> Dict[str, object]:
         paper_identifier = self.paper_id.rsplit("/", maxsplit=1)[-1]
-        url = f"https://api.openalex.org/works/{paper_identifier}"
-        payload = self.fetch_json(url)
+        query = urllib.parse.urlencode({"select": _OPENALEX_SELECT})
+        url = f"https://api.openalex.org/works/{paper_identifier}?{query}"
+        return self._paper_metadata(self.paper_id, self.fetch_json(url))
+
+    def fetch_papers_metadata(self, paper_ids: Iterable[str]) -> Dict[str, Dict[str, object]]:
+        """Fetch several OpenAlex works with one request per 100 identifiers.
 
+        The result is keyed by the identifiers as passed in; ids OpenAlex does not return are omitted.
+        """
+        # Several caller spellings (URL, bare ID, lower case) may name the same work; answer each one.
+        by_identifier: Dict[str, List[str]] = {}
+        for paper_id in paper_ids:
+            by_identifier.setdefault(paper_id.rsplit("/", maxsplit=1)[-1].upper(), []).append(paper_id)
+        identifiers = list(by_identifier)
+        papers: Dict[str, Dict[str, object]] = {}
+        for start in range(0, len(identifiers), _OPENALEX_FILTER_LIMIT):
+            chunk = identifiers[start : start + _OPENALEX_FILTER_LIMIT]
+            query = urllib.parse.urlencode(
+                {"filter": f"openalex_id:{'|'.join(chunk)}", "select": _OPENALEX_SELECT, "per-page": 200}
+            )
+            payload = self.fetch_json(f"https://api.openalex.org/works?{query}")
+            for work in payload.get("results", []):
+                identifier = str(work.get("id", "")).rsplit("/", maxsplit=1)[-1].upper()
+                for paper_id in by_identifier.get(identifier, ()):
+                    papers[paper_id] = self._paper_metadata(paper_id, work)
+        return papers
+
+    def _paper_metadata(self, paper_id: str, payload: Mapping[str, object]) -> Dict[str, object]:
         authors: List[str] = [
-            authorship.get("author", {}).get("display_name", "")
-            for authorship in payload.get("authorships", [])
+            author["display_name"]
+            for authorship in payload.get("authorships") or ()
+            if (author := authorship.get("author")) and author.get("display_name")
         ]
 
-        publication_year = payload.get("publication_year") or payload.get("primary_location", {}).get(
-            "source", {}
-        ).get("publication_year")
+        source = (payload.get("primary_location") or {}).get("source") or {}
+        publication_year = payload.get("publication_year") or source.get("publication_year")
 
         return {
-            "paper_id": self.paper_id,
+            "paper_id": paper_id,
             "title": payload.get("display_name", "Unknown Title"),
             "published_year": publication_year,
-            "authors": [name for name in authors if name],
-            "venue": payload.get("host_venue", {}).get("display_name"),
+            "authors": authors,
+            "venue": source.get("display_name"),
         }
 
     def fetch_repo_metadata(self) -> Dict[str, object]:
-        parsed = urllib.parse.urlparse(self.github_id)
-        owner, repo = parsed.path.strip("/").split("/", maxsplit=1)
-        url = f"https://api.github.com/repos/{owner}/{repo}"
-        headers = {"Accept": "application/vnd.github+json"}
-        if self.github_token:
-            headers["Authorization"] = f"Bearer {self.github_token}"
-        payload = self.fetch_json(url, headers=headers)
+        if not self.github_token:
+            # The GraphQL API rejects anonymous requests; fall back to the full REST object.
+            payload = self.fetch_json(self._repo_url, headers=self._gh_headers)
+            return {
+                "github_id": self.github_id,
+                "default_branch": payload.get("default_branch"),
+                "stars": payload.get("stargazers_count"),
+                "forks": payload.get("forks_count"),
+                "open_issues": payload.get("open_issues_count"),
+                "primary_language": payload.get("language"),
+                "updated_at": payload.get("pushed_at"),
+            }
+
+        payload = self.fetch_json(
+            "https://api.github.com/graphql",
+            headers=self._gh_headers,
+            data={"query": _GITHUB_REPOSITORY_QUERY, "variables": {"owner": self._owner, "name": self._repo}},
+            validate=self._check_graphql_repository,
+        )
+        repository = payload["data"]["repository"]
 
         return {
             "github_id": self.github_id,
-            "default_branch": payload.get("default_branch"),
-            "stars": payload.get("stargazers_count"),
-            "forks": payload.get("forks_count"),
-            "open_issues": payload.get("open_issues_count"),
-            "primary_language": payload.get("language"),
-            "updated_at": payload.get("pushed_at"),
+            "default_branch": (repository.get("defaultBranchRef") or {}).get("name"),
+            "stars": repository.get("stargazerCount"),
+            "forks": repository.get("forkCount"),
+            # REST's open_issues_count includes open pull requests; keep the same meaning.
+            "open_issues": repository["issues"]["totalCount"] + repository["pullRequests"]["totalCount"],
+            "primary_language": (repository.get("primaryLanguage") or {}).get("name"),
+            "updated_at": repository.get("pushedAt"),
         }
 
+    def _check_graphql_repository(self, payload: Mapping[str, object]) -> None:
+        # GraphQL reports failures (rate limiting, unknown repository) as HTTP 200 with an errors array.
+        if payload.get("errors") or (payload.get("data") or {}).get("repository") is None:
+            messages = "; ".join(error.get("message", "") for error in payload.get("errors") or [])
+            raise RuntimeError(f"Failed to fetch {self.github_id}: {messages or 'repository not found'}")
+
+    # -------------------------- Connections ---------------------------
+    def _request(
+        self, url: str, headers: Mapping[str, str], data: Optional[bytes] = None
+    ) -> Tuple[int, http.client.HTTPMessage, bytes]:
+        for _ in range(_MAX_REDIRECTS + 1):
+            parsed = urllib.parse.urlsplit(url)
+            proxy = _proxy_for(parsed.scheme, parsed.hostname or "")
+            key = (parsed.scheme, parsed.netloc, proxy.geturl() if proxy else "")
+            target = urllib.parse.urlunsplit(("", "", parsed.path or "/", parsed.query, ""))
+            request_headers = headers
+            if proxy is not None and parsed.scheme != "https":
+                # Plain HTTP goes to the proxy itself, addressed by the absolute URL.
+                target = urllib.parse.urlunsplit((parsed.scheme, parsed.netloc, parsed.path or "/", parsed.query, ""))
+                request_headers = {**headers, **_proxy_auth_headers(proxy)}
+            connection = self._acquire_connection(key, proxy)
+            try:
+                try:
+                    response, raw = self._send(connection, target, request_headers, data)
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    # The server dropped an idle keep-alive socket; reconnect once.
+                    connection.close()
+                    response, raw = self._send(connection, target, request_headers, data)
+            except (http.client.HTTPException, OSError):
+                connection.close()
+                raise
+            self._release_connection(key, connection)
+
+            location = response.getheader("Location")
+            if response.status not in _REDIRECT_STATUSES or not location:
+                return response.status, response.headers, raw
+            url = urllib.parse.urljoin(url, location)
+            if response.status in (301, 302, 303):
+                data = None  # Like urlopen, follow these redirects with a plain GET.
+        raise http.client.HTTPException(f"more than {_MAX_REDIRECTS} redirects")
+
+    @staticmethod
+    def _send(
+        connection: http.client.HTTPConnection, target: str, headers: Mapping[str, str], data: Optional[bytes]
+    ) -> Tuple[http.client.HTTPResponse, bytes]:
+        connection.request("GET" if data is None else "POST", target, body=data, headers=dict(headers))
+        response = connection.getresponse()
+        return response, response.read()
+
+    def _acquire_connection(
+        self, key: Tuple[str, str, str], proxy: Optional[urllib.parse.SplitResult]
+    ) -> http.client.HTTPConnection:
+        with self._pool_lock:
+            idle = self._connections.get(key)
+            if idle:
+                return idle.pop()
+        return self._new_connection(key[0], key[1], proxy)
+
+    def _new_connection(
+        self, scheme: str, netloc: str, proxy: Optional[urllib.parse.SplitResult]
+    ) -> http.client.HTTPConnection:
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        if proxy is None:
+            return connection_class(netloc, timeout=15)
+        # Same proxy handling as urlopen: CONNECT tunnel for HTTPS, absolute-URL requests for HTTP.
+        connection = connection_class(proxy.hostname, proxy.port or 80, timeout=15)
+        if scheme == "https":
+            connection.set_tunnel(netloc, headers=_proxy_auth_headers(proxy))
+        return connection
+
+    def _release_connection(self, key: Tuple[str, str, str], connection: http.client.HTTPConnection) -> None:
+        with self._pool_lock:
+            self._connections.setdefault(key, []).append(connection)
+
+    def close(self) -> None:
+        """Close any pooled keep-alive connections."""
+        with self._pool_lock:
+            pools, self._connections = self._connections, {}
+        for idle in pools.values():
+            for connection in idle:
+                connection.close()
+
+    # ----------------------------- Cache ------------------------------
+    def _cache_path(self, url: str, headers: Mapping[str, str], data: Optional[bytes] = None) -> str:
+        key = json.dumps([url, sorted(headers.items()), data.decode("utf-8") if data else None]).encode("utf-8")
+        digest = hashlib.blake2b(key, digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def _read_cache(self, path: str) -> Optional[Dict]:
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, path: str, entry: Mapping[str, object]) -> None:
+        # The cache is only an optimisation; a failed write must not fail the fetch that produced ``entry``.
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(entry, fh)
+            os.replace(tmp_path, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+
     # ------------------------- Transformations -----------------------
-    def compute_rwe_score(self, repo_metadata: Mapping[str, object]) -> MutableMapping[str, float]:
+    def compute_rwe_score(self, repo_metadata: Mapping[str, object]) -> RweScore:
         stars = float(repo_metadata.get("stars") or 0)
         forks = float(repo_metadata.get("forks") or 0)
         issues = float(repo_metadata.get("open_issues") or 0)
+        return _rwe_score(stars, forks, issues)
 
-        def normalize(value: float, scale: float = 500.0) -> float:
-            return min(value / scale, 1.0)
-
-        github_activity = (normalize(stars) * 0.6) + (normalize(forks) * 0.3) + (normalize(max(1.0, issues)) * 0.1)
-        huggingface_downloads = 0.42  # Placeholder for future HF API integration.
-        citations = 0.38  # Placeholder until citation counts are ingested.
-        community_adoption = min((github_activity + huggingface_downloads) / 2, 1.0)
-        aggregate = (github_activity + huggingface_downloads + citations + community_adoption) / 4
-
-        return {
-            "github_activity": round(github_activity, 2),
-            "huggingface_downloads": round(huggingface_downloads, 2),
-            "citations": round(citations, 2),
-            "community_adoption": round(community_adoption, 2),
-            "aggregate": round(aggregate, 2),
-        }
+    def compute_rwe_scores_batch(self, repo_metadata_list: Iterable[Mapping[str, object]]) -> List[RweScore]:
+        """Score each repository in ``repo_metadata_list``, in order, as ``compute_rwe_score`` would."""
+        return [self.compute_rwe_score(repo_metadata) for repo_metadata in repo_metadata_list]
 
     def build_artifacts(self, repo_metadata: Mapping[str, object]) -> Dict[str, List[Dict[str, object]]]:
         return {
@@ -139,16 +563,20 @@ class ReproAIReport:
             ],
         }
 
+    def fetch_metadata(self) -> Tuple[Dict[str, object], Dict[str, object]]:
+        # OpenAlex and GitHub are independent round-trips; overlap them.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            paper_future = executor.submit(self.fetch_paper_metadata)
+            repo_future = executor.submit(self.fetch_repo_metadata)
+            return paper_future.result(), repo_future.result()
+
     def assemble_report(self) -> Dict[str, object]:
-        paper_metadata = self.fetch_paper_metadata()
-        repo_metadata = self.fetch_repo_metadata()
+        paper_metadata, repo_metadata = self.fetch_metadata()
         rwe = self.compute_rwe_score(repo_metadata)
         artifacts = self.build_artifacts(repo_metadata)
 
-        timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
-        slug = repo_metadata.get("github_id", "report").rsplit("/", maxsplit=1)[-1]
-        json_path = os.path.join(self.output_dir, f"{slug}.json")
-        html_path = os.path.join(self.output_dir, f"{slug}.html")
+        # Formatted once in C; matches the documented "2025-02-15T12:34:56Z" shape.
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
         return {
             "metadata": {
@@ -158,13 +586,13 @@ class ReproAIReport:
             "reproducibility_assessment": {
                 "class": "II",
                 "classification_rationale": "Heuristic classification based on repository activity and metadata completeness.",
-                "rwe_score": rwe["aggregate"],
-                "rwe_dimensions": {k: v for k, v in rwe.items() if k != "aggregate"},
+                "rwe_score": rwe.aggregate,
+                "rwe_dimensions": {k: v for k, v in rwe.as_dict().items() if k != "aggregate"},
             },
             "artifacts": artifacts,
             "report": {
-                "json_path": json_path,
-                "html_path": html_path,
+                "json_path": self._json_path,
+                "html_path": self._html_path,
                 "generated_at": timestamp,
             },
         }
@@ -178,102 +606,78 @@ class ReproAIReport:
         artifacts = report.get("artifacts", {})
         dimensions = assessment.get("rwe_dimensions", {})
 
-        html = f"""
-        <html>
-          <head>
-            <title>Reproducible AI Report</title>
-            <style>
-              body {{ font-family: Arial, sans-serif; margin: 2rem; }}
-              h1, h2, h3 {{ color: #12355b; }}
-              .card {{ border: 1px solid #e1e4e8; padding: 1rem; margin-bottom: 1rem; border-radius: 8px; }}
-              .grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(240px, 1fr)); gap: 1rem; }}
-              table {{ width: 100%; border-collapse: collapse; }}
-              th, td {{ padding: 0.5rem; border-bottom: 1px solid #e1e4e8; text-align: left; }}
-              code {{ background: #f6f8fa; padding: 0.2rem 0.4rem; border-radius: 4px; }}
-            </style>
-          </head>
-          <body>
-            <h1>Reproducible AI Report</h1>
-            <div class="card">
-              <h2>Paper</h2>
-              <p><strong>Title:</strong> {paper.get('title')}</p>
-              <p><strong>Authors:</strong> {', '.join(paper.get('authors', []))}</p>
-              <p><strong>Published:</strong> {paper.get('published_year')}</p>
-              <p><strong>Venue:</strong> {paper.get('venue')}</p>
-              <p><strong>OpenAlex ID:</strong> <code>{paper.get('paper_id')}</code></p>
-            </div>
-
-            <div class="card">
-              <h2>Repository</h2>
-              <p><strong>GitHub:</strong> <code>{repo.get('github_id')}</code></p>
-              <p><strong>Default branch:</strong> {repo.get('default_branch')}</p>
-              <div class="grid">
-                <div><strong>Stars:</strong> {repo.get('stars')}</div>
-                <div><strong>Forks:</strong> {repo.get('forks')}</div>
-                <div><strong>Open issues:</strong> {repo.get('open_issues')}</div>
-                <div><strong>Primary language:</strong> {repo.get('primary_language')}</div>
-                <div><strong>Last push:</strong> {repo.get('updated_at')}</div>
-              </div>
-            </div>
-
-            <div class="card">
-              <h2>Reproducibility Assessment</h2>
-              <p><strong>Class:</strong> {assessment.get('class')}</p>
-              <p><strong>Rationale:</strong> {assessment.get('classification_rationale')}</p>
-              <h3>Real-world Evidence</h3>
-              <table>
-                <thead><tr><th>Dimension</th><th>Score</th></tr></thead>
-                <tbody>
-                  {''.join(f"<tr><td>{key}</td><td>{value}</td></tr>" for key, value in dimensions.items())}
-                </tbody>
-              </table>
-              <p><strong>Aggregate RWE Score:</strong> {assessment.get('rwe_score')}</p>
-            </div>
-
-            <div class="card">
-              <h2>Artifacts</h2>
-              {self._render_artifacts_section(artifacts)}
-            </div>
-
-            <p><em>Generated at {report.get('report', {}).get('generated_at')}</em></p>
-          </body>
-        </html>
-        """
-        return textwrap.dedent(html)
+        rwe_rows = "".join(
+            f"<tr><td>{_escape(key)}</td><td>{_escape(value)}</td></tr>" for key, value in dimensions.items()
+        )
+        return _HTML_TEMPLATE.format_map(
+            {
+                "paper_title": _escape(paper.get("title")),
+                "paper_authors": _escape(", ".join(paper.get("authors", []))),
+                "paper_published_year": _escape(paper.get("published_year")),
+                "paper_venue": _escape(paper.get("venue")),
+                "paper_id": _escape(paper.get("paper_id")),
+                "repo_github_id": _escape(repo.get("github_id")),
+                "repo_default_branch": _escape(repo.get("default_branch")),
+                "repo_stars": _escape(repo.get("stars")),
+                "repo_forks": _escape(repo.get("forks")),
+                "repo_open_issues": _escape(repo.get("open_issues")),
+                "repo_primary_language": _escape(repo.get("primary_language")),
+                "repo_updated_at": _escape(repo.get("updated_at")),
+                "assessment_class": _escape(assessment.get("class")),
+                "assessment_rationale": _escape(assessment.get("classification_rationale")),
+                "rwe_rows": rwe_rows,
+                "rwe_score": _escape(assessment.get("rwe_score")),
+                "artifacts_html": self._render_artifacts_section(artifacts),
+                "generated_at": _escape(report.get("report", {}).get("generated_at")),
+            }
+        )
 
     def _render_artifacts_section(self, artifacts: Mapping[str, Iterable[Mapping[str, object]]]) -> str:
-        sections: List[str] = []
+        buf: List[str] = []
+        append = buf.append
         for section_name, items in artifacts.items():
-            rows = [
-                """<tr>{}</tr>""".format(
-                    "".join(f"<td>{value}</td>" for value in item.values())
-                )
-                for item in items
-            ]
-            headers = "".join(f"<th>{header}</th>" for header in (items[0].keys() if items else []))
-            table = f"""
-                <h3>{section_name.title()}</h3>
-                <table>
-                  <thead><tr>{headers}</tr></thead>
-                  <tbody>{''.join(rows)}</tbody>
-                </table>
-            """
-            sections.append(table)
-        return "\n".join(sections)
+            rows = iter(items)
+            item = next(rows, None)
+            append(f"<h3>{_escape(section_name.title())}</h3>\n<table>\n  <thead><tr>")
+            # Headers come from the first item, which is then rendered as the first row.
+            for header in item.keys() if item is not None else ():
+                append(f"<th>{_escape(header)}</th>")
+            append("</tr></thead>\n  <tbody>")
+            while item is not None:
+                append("<tr>")
+                for value in item.values():
+                    append(f"<td>{_escape(value)}</td>")
+                append("</tr>")
+                item = next(rows, None)
+            append("</tbody>\n</table>\n")
+        return "".join(buf)
 
     # ----------------------------- Runner -----------------------------
     def run(self) -> Dict[str, object]:
-        os.makedirs(self.output_dir, exist_ok=True)
-        report = self.assemble_report()
+        try:
+            report = self.assemble_report()
+        finally:
+            self.close()
+
+        # Writing the JSON report does not depend on the HTML, so let it proceed while rendering.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            json_future = executor.submit(self._write_json, report["report"]["json_path"], report)
+            html_content = self.render_html(report)
+            html_future = executor.submit(self._write_text, report["report"]["html_path"], html_content)
+            json_future.result()
+            html_future.result()
 
-        with open(report["report"]["json_path"], "w", encoding="utf-8") as fh:
-            json.dump(report, fh, indent=2)
+        return report
 
-        html_content = self.render_html(report)
-        with open(report["report"]["html_path"], "w", encoding="utf-8") as fh:
-            fh.write(html_content)
+    @staticmethod
+    def _write_json(path: str, report: Mapping[str, object]) -> None:
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
 
-        return report
+    @staticmethod
+    def _write_text(path: str, content: str) -> None:
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(content)
 
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
@@ -293,6 +697,12 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default=None,
         help="GitHub token to increase rate limits (optional)",
     )
+    run_parser.add_argument(
+        "--cache_ttl",
+        type=float,
+        default=3600.0,
+        help="Seconds to reuse cached API responses before revalidating (default: 3600)",
+    )
 
     return parser.parse_args(argv)
 
@@ -305,6 +715,7 @@ def main(argv: Optional[List[str]] = None) -> None:
             github_id=args.github_id,
             output_dir=args.output_dir,
             github_token=args.github_token,
+            cache_ttl=args.cache_ttl,
         ).run()
         print(f"Report written to {report['report']['json_path']} and {report['report']['html_path']}")
 